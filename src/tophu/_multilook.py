@@ -1,20 +1,316 @@
 from __future__ import annotations
 
+import functools
+import itertools
+import math
 import warnings
-from collections.abc import Iterable
-from typing import Tuple, cast
+from collections.abc import Iterable, Sequence
 
 import dask.array as da
 import numpy as np
 
-from ._util import iseven
-
 __all__ = [
     "multilook",
 ]
 
 
-def multilook(arr: da.Array, nlooks: int | Iterable[int]) -> da.Array:
+def _aligned_chunks(chunks: tuple[int, ...], n: int) -> tuple[int, ...]:
+    """
+    Adjust the chunk sizes along an axis to be integer multiples of `n`.
+
+    Each chunk boundary is snapped to the nearest multiple of `n` and any resulting
+    empty chunks are dropped. The number of chunks is therefore roughly preserved, and
+    each chunk retains most of its original data, which limits the amount of data that
+    must be exchanged between neighboring chunks during rechunking.
+
+    If the total length of the axis is not an integer multiple of `n`, the remainder
+    samples are included in the last chunk, which is then the only chunk whose size is
+    not a multiple of `n`.
+
+    Parameters
+    ----------
+    chunks : tuple of int
+        Chunk sizes along the axis. The total length of the axis must be at least `n`.
+    n : int
+        The chunk size multiple.
+
+    Returns
+    -------
+    aligned_chunks : tuple of int
+        The adjusted chunk sizes.
+    """
+    # The total length of the axis, and the length of the portion of the axis that is
+    # an integer multiple of `n`.
+    length = sum(chunks)
+    valid_length = length - length % n
+
+    # Get the (exclusive) upper bound of each chunk, snapped to the nearest multiple of
+    # `n`. Duplicate or out-of-range bounds correspond to empty chunks (or chunks that
+    # contain only remainder samples), which are discarded. The last chunk always
+    # extends to the end of the axis.
+    snapped_bounds = (n * ((b + n // 2) // n) for b in itertools.accumulate(chunks))
+    bounds = sorted({b for b in snapped_bounds if 0 < b < valid_length} | {length})
+    return tuple(b - a for (a, b) in zip([0] + bounds[:-1], bounds))
+
+
+def _normalize_nlooks(nlooks: int | Iterable[int], ndim: int) -> tuple[int, ...]:
+    """
+    Normalize the number of looks into a tuple with one entry per array axis.
+
+    Parameters
+    ----------
+    nlooks : int or iterable of int
+        Number of looks along each axis. If `nlooks` is a scalar, the same number of
+        looks is taken along each axis.
+    ndim : int
+        Number of array dimensions.
+
+    Returns
+    -------
+    nlooks : tuple of int
+        Number of looks along each axis.
+    """
+    # Check for a scalar explicitly, rather than attempting `int(nlooks)` and catching
+    # the resulting `TypeError`, so that the common case of a tuple input doesn't raise
+    # & handle an exception. Zero-dimensional arrays are iterable according to
+    # `collections.abc.Iterable`, but are treated as scalars.
+    if (not isinstance(nlooks, Iterable)) or (
+        isinstance(nlooks, np.ndarray) and (nlooks.ndim == 0)
+    ):
+        return (int(nlooks),) * ndim
+
+    nlooks = tuple([int(n) for n in nlooks])
+    if len(nlooks) != ndim:
+        raise ValueError(
+            f"length mismatch: length of nlooks ({len(nlooks)}) must match input"
+            f" array rank ({ndim})"
+        )
+    return nlooks
+
+
+# The maximum number of looks along the contiguous axis for which blocks are multilooked
+# by accumulating strided views (see `_sum_looks_strided()`). Beyond this, the strided
+# reads along the contiguous axis become more costly than reducing it with
+# `numpy.add.reduceat()`.
+_MAX_STRIDED_LOOKS = 5
+
+
+def _axes_by_stride(arr: np.ndarray) -> list[int]:
+    """Get the axes of the input array, sorted in order of increasing stride."""
+    return sorted(range(arr.ndim), key=lambda axis: abs(arr.strides[axis]))
+
+
+@functools.lru_cache(maxsize=32)
+def _window_slices(nlooks: tuple[int, ...]) -> tuple[tuple[slice, ...], ...]:
+    """
+    Get the strided slices that select each look within a multilook window.
+
+    The slices depend only on `nlooks`, so they're cached and reused across all blocks
+    (and all arrays) multilooked with the same number of looks.
+
+    Parameters
+    ----------
+    nlooks : tuple of int
+        Number of looks along each axis.
+
+    Returns
+    -------
+    slices : tuple of tuple of slice
+        One index expression per look. Each selects a strided view of an array with
+        shape equal to an integer multiple of `nlooks`, with one sample per window.
+    """
+    offsets = itertools.product(*(range(n) for n in nlooks))
+    return tuple(
+        tuple(slice(i, None, n) for (i, n) in zip(offset, nlooks)) for offset in offsets
+    )
+
+
+def _sum_looks_strided(
+    block: np.ndarray, nlooks: tuple[int, ...], out: np.ndarray
+) -> None:
+    """
+    Sum each group of looks by accumulating strided views of the input block.
+
+    Each offset within the multilook window selects a strided view of the block with
+    the same shape as the output. The views are accumulated into the output buffer, so
+    the cost is dominated by one elementwise addition per look.
+
+    Parameters
+    ----------
+    block : numpy.ndarray
+        Input block. Its shape must be an integer multiple of `nlooks`.
+    nlooks : tuple of int
+        Number of looks along each axis of the input block.
+    out : numpy.ndarray
+        Output buffer in which to store the sum of each group of looks.
+    """
+    first, *rest = _window_slices(nlooks)
+    out[...] = block[first]
+    for index in rest:
+        out += block[index]
+
+
+def _sum_looks_reduceat(
+    block: np.ndarray,
+    nlooks: tuple[int, ...],
+    axes: Sequence[int],
+    out: np.ndarray,
+) -> None:
+    """
+    Sum each group of looks by reducing along each axis of the input block in turn.
+
+    Parameters
+    ----------
+    block : numpy.ndarray
+        Input block. Its shape must be an integer multiple of `nlooks`.
+    nlooks : tuple of int
+        Number of looks along each axis of the input block. Must be greater than 1 along
+        at least one axis.
+    axes : sequence of int
+        The axes of the input block, in order of increasing stride.
+    out : numpy.ndarray
+        Output buffer in which to store the sum of each group of looks.
+    """
+    # Sum over each group of `n` consecutive samples along each axis in turn. Axes are
+    # reduced in order of increasing stride, so the contiguous axis (the last axis of a
+    # C-ordered block or the first axis of a Fortran-ordered block) is reduced first --
+    # each pass shrinks the working array by a factor of `n` along the reduced axis, so
+    # the subsequent strided passes over the outer axes touch less memory. Axes with a
+    # single look don't need to be reduced.
+    #
+    # If the input datatype differs from the output datatype (e.g. for integer-valued
+    # inputs), the first pass accumulates in the output datatype, which avoids overflow
+    # without first making a converted copy of the whole block. (Passing `dtype` when
+    # the datatypes already match needlessly selects NumPy's slower buffered casting
+    # loop, so it's omitted in that case.) The final pass writes directly into the
+    # output buffer.
+    *inner_axes, last_axis = (axis for axis in axes if nlooks[axis] > 1)
+    tmp = block
+    for axis in inner_axes:
+        indices = np.arange(0, tmp.shape[axis], nlooks[axis])
+        dtype = None if (tmp.dtype == out.dtype) else out.dtype
+        tmp = np.add.reduceat(tmp, indices, axis=axis, dtype=dtype)
+    indices = np.arange(0, tmp.shape[last_axis], nlooks[last_axis])
+    dtype = None if (tmp.dtype == out.dtype) else out.dtype
+    np.add.reduceat(tmp, indices, axis=last_axis, dtype=dtype, out=out)
+
+
+def _mean_looks_reshape(
+    block: np.ndarray, nlooks: tuple[int, ...], accum_dtype: np.dtype
+) -> np.ndarray:
+    """
+    Average each group of looks using the input block's own `mean()` method.
+
+    This is slower than the other kernels, but it defers to the semantics of the
+    block's array type. In particular, it respects the mask of a masked array.
+
+    Parameters
+    ----------
+    block : numpy.ndarray
+        Input block. Its shape must be an integer multiple of `nlooks`.
+    nlooks : tuple of int
+        Number of looks along each axis of the input block.
+    accum_dtype : numpy.dtype
+        Datatype in which to accumulate the sum of each group of looks.
+
+    Returns
+    -------
+    out : numpy.ndarray
+        The mean of each group of looks.
+    """
+    # Split each axis of length `m` into a pair of axes with lengths `(m // n, n)`, and
+    # then average over every second axis.
+    tmp_shape = tuple(
+        itertools.chain.from_iterable(
+            (m // n, n) for (m, n) in zip(block.shape, nlooks)
+        )
+    )
+    axes = tuple(range(1, 2 * block.ndim, 2))
+    return block.reshape(tmp_shape).mean(axis=axes, dtype=accum_dtype)
+
+
+def _multilook_block(
+    block: np.ndarray,
+    nlooks: tuple[int, ...],
+    out_dtype: np.dtype,
+    accum_dtype: np.dtype | None = None,
+) -> np.ndarray:
+    """
+    Multilook a single block of an array by simple averaging.
+
+    If the shape of the block is not an integer multiple of `nlooks` along each axis,
+    any remainder samples from the end of the block are discarded.
+
+    Parameters
+    ----------
+    block : numpy.ndarray
+        Input block.
+    nlooks : tuple of int
+        Number of looks along each axis of the input block.
+    out_dtype : numpy.dtype
+        Output datatype.
+    accum_dtype : numpy.dtype or None, optional
+        Datatype in which to accumulate the sum of each group of looks. If None, the
+        output datatype is used. Defaults to None.
+
+    Returns
+    -------
+    out : numpy.ndarray
+        Multilooked block.
+    """
+    # Trim any remainder samples. This is just a view of the input block. Only the last
+    # block along each axis may contain remainder samples, so in most cases no trimming
+    # is needed.
+    valid_shape = tuple(m - m % n for (m, n) in zip(block.shape, nlooks))
+    if valid_shape != block.shape:
+        block = block[tuple(slice(m) for m in valid_shape)]
+
+    # Subclasses of `numpy.ndarray` (e.g. masked arrays) may redefine the meaning of the
+    # mean, so the kernels below, which operate on the raw data, can't be used for them.
+    if isinstance(block, np.ndarray) and (type(block) is not np.ndarray):
+        if accum_dtype is None:
+            accum_dtype = out_dtype
+        return _mean_looks_reshape(block, nlooks, accum_dtype).astype(
+            out_dtype, copy=False
+        )
+
+    # Allocate the output buffer. The buffer has the same memory layout and array type
+    # as the input block.
+    out_shape = tuple(m // n for (m, n) in zip(block.shape, nlooks))
+    out = np.empty_like(block, dtype=out_dtype, shape=out_shape)
+
+    # Sum over each group of looks. For small multilook windows along the contiguous
+    # axis, accumulating strided views is typically several times faster than
+    # `numpy.add.reduceat()`, which has a high per-group overhead when the groups are
+    # short. Non-NumPy blocks (e.g. CuPy arrays) always take the strided path, since it
+    # relies only on indexing and elementwise arithmetic, which any NumPy-like array
+    # type supports -- on a GPU, this amounts to one coalesced, bandwidth-bound
+    # elementwise kernel per look. The axis ordering is computed once here and reused
+    # by `_sum_looks_reduceat()`.
+    #
+    # If a wider accumulator datatype was requested, sum into a temporary buffer and
+    # then convert the result into the output buffer.
+    if (accum_dtype is None) or (accum_dtype == out.dtype):
+        accum = out
+    else:
+        accum = np.empty_like(out, dtype=accum_dtype)
+
+    axes = _axes_by_stride(block)
+    if (not isinstance(block, np.ndarray)) or (nlooks[axes[0]] <= _MAX_STRIDED_LOOKS):
+        _sum_looks_strided(block, nlooks, accum)
+    else:
+        _sum_looks_reduceat(block, nlooks, axes, accum)
+
+    # Normalize in-place to get the mean.
+    accum /= math.prod(nlooks)
+    if accum is not out:
+        out[...] = accum
+    return out
+
+
+def multilook(
+    arr: da.Array, nlooks: int | Iterable[int], *, high_precision: bool = False
+) -> da.Array:
     """
     Multilook an array by simple averaging.
 
@@ -24,9 +320,17 @@ def multilook(arr: da.Array, nlooks: int | Iterable[int]) -> da.Array:
     Parameters
     ----------
     arr : dask.array.Array
-        Input array.
+        Input array. The array's blocks may be NumPy arrays or other NumPy-like arrays
+        that support strided indexing and elementwise arithmetic (e.g. CuPy arrays).
+        Blocks that are subclasses of `numpy.ndarray` are averaged using their own
+        `mean()` method, so masked arrays respect their masks.
     nlooks : int or iterable of int
         Number of looks along each axis of the input array.
+    high_precision : bool, optional
+        If True, accumulate the sum of each group of looks in double precision (float64
+        or complex128). Otherwise, sums are accumulated in the datatype of the output
+        array, or in single precision for half-precision inputs. The output datatype is
+        unaffected. Defaults to False.
 
     Returns
     -------
@@ -38,22 +342,25 @@ def multilook(arr: da.Array, nlooks: int | Iterable[int]) -> da.Array:
     If the length of the input array along a given axis is not evenly divisible by the
     specified number of looks, any remainder samples from the end of the array will be
     discarded in the output.
+
+    Each block of the input array is multilooked independently. If the chunk sizes of
+    the input array are not integer multiples of the specified number of looks, the
+    array will first be rechunked such that they are. Chunk boundaries are moved to the
+    nearest multiple of `nlooks`, so the number of chunks is approximately preserved.
+
+    By default, single-precision floating-point inputs (float32 or complex64) are summed
+    in single precision. Since each output sample is the mean of only ``prod(nlooks)``
+    input samples, the accumulated rounding error is typically small. Half-precision
+    (float16) inputs are widened and summed in single precision, since float16 sums
+    readily overflow. Set `high_precision` to True to accumulate in double precision
+    instead, at the cost of additional memory traffic. In either case, the output has
+    the same datatype.
+
+    If `nlooks` is 1 along each axis, multilooking is a no-op and the input array is
+    returned unchanged (including its datatype).
     """
-    # Normalize `nlooks` into a tuple with length equal to `arr.ndim`. If `nlooks` was a
-    # scalar, take the same number of looks along each axis in the array.
-    try:
-        n = int(nlooks)  # type: ignore
-        nlooks = (n,) * arr.ndim
-    except TypeError:
-        nlooks = tuple([int(n) for n in nlooks])  # type: ignore
-        if len(nlooks) != arr.ndim:
-            raise ValueError(
-                f"length mismatch: length of nlooks ({len(nlooks)}) must match input"
-                f" array rank ({arr.ndim})"
-            )
-
-    # Convince static type checkers that `nlooks` is a tuple of ints now.
-    nlooks = cast(Tuple[int, ...], nlooks)
+    # Normalize `nlooks` into a tuple with length equal to `arr.ndim`.
+    nlooks = _normalize_nlooks(nlooks, arr.ndim)
 
     # The number of looks must be at least 1 and at most the size of the input array
     # along the corresponding axis.
@@ -63,12 +370,20 @@ def multilook(arr: da.Array, nlooks: int | Iterable[int]) -> da.Array:
         elif n > m:
             raise ValueError("number of looks should not exceed array shape")
 
-    # Warn if the number of looks along any axis is even-valued.
-    if any(map(iseven, nlooks)):
+    # Taking a single look along each axis is a no-op, so just return the input array
+    # rather than adding a redundant layer to the task graph.
+    if all(n == 1 for n in nlooks):
+        return arr
+
+    # Warn if the number of looks along any axis is even-valued. Warnings are attributed
+    # to the caller's frame, so that (with the default warnings filter) each warning is
+    # only shown once per call site rather than repeatedly from inside a loop.
+    if any(not (n & 1) for n in nlooks):
         warnings.warn(
             "one or more components of nlooks is even-valued -- this will result in"
             " a phase delay in the multilooked data equivalent to a half-bin shift",
             RuntimeWarning,
+            stacklevel=2,
         )
 
     # Warn if any array dimensions are not integer multiples of `nlooks`.
@@ -77,17 +392,46 @@ def multilook(arr: da.Array, nlooks: int | Iterable[int]) -> da.Array:
             "input array shape is not an integer multiple of nlooks -- remainder"
             " samples will be excluded from output",
             RuntimeWarning,
+            stacklevel=2,
         )
 
-        # XXX Workaround for https://github.com/dask/dask/issues/10274 -- trim excess
-        # samples before passing to `dask.array.coarsen()`.
-        def valid_slice(m: int, n: int) -> slice:
-            rem = m % n
-            return slice(-rem) if (rem != 0) else slice(None)
+    # The output has the same datatype as `numpy.mean()` would produce -- floating-point
+    # inputs retain their precision, while integer inputs are promoted to float64.
+    if np.issubdtype(arr.dtype, np.inexact):
+        dtype = arr.dtype
+    else:
+        dtype = np.dtype(np.float64)
+
+    # Get the datatype in which the sum of each group of looks is accumulated.
+    # Half-precision inputs are always accumulated in (at least) single precision, since
+    # float16 sums readily overflow or lose precision.
+    if high_precision:
+        accum_dtype = np.promote_types(dtype, np.float64)
+    else:
+        accum_dtype = np.promote_types(dtype, np.float32)
 
-        s = tuple(valid_slice(m, n) for (m, n) in zip(arr.shape, nlooks))
-        arr = arr[s]
+    # Each block is multilooked independently, so each chunk must be an integer
+    # multiple of `nlooks` along each axis (except for the last chunk along each axis,
+    # which also holds any remainder samples, to be discarded by `_multilook_block()`).
+    # Rechunk the array if necessary. Trimming the remainder samples within the last
+    # block, rather than by slicing the full array beforehand, avoids adding an extra
+    # layer to the task graph.
+    aligned_chunks = tuple(
+        _aligned_chunks(chunks, n) for (chunks, n) in zip(arr.chunks, nlooks)
+    )
+    if aligned_chunks != arr.chunks:
+        arr = arr.rechunk(aligned_chunks)
 
-    axes = range(arr.ndim)
-    nlooks_dict = {axis: n for (axis, n) in zip(axes, nlooks)}
-    return da.coarsen(np.mean, arr, nlooks_dict)
+    out_chunks = tuple(
+        tuple(c // n for c in chunks) for (chunks, n) in zip(arr.chunks, nlooks)
+    )
+    return da.map_blocks(
+        _multilook_block,
+        arr,
+        nlooks=nlooks,
+        out_dtype=dtype,
+        accum_dtype=accum_dtype,
+        dtype=dtype,
+        chunks=out_chunks,
+        meta=arr._meta.astype(dtype),
+    )
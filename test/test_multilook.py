@@ -80,6 +80,116 @@ class TestMultilook:
         assert output.dtype == expected.dtype
         assert da.allclose(output, expected, rtol=1e-12, atol=1e-12)
 
+    @pytest.mark.parametrize("nlooks", [(3, 5), (3, 7)])
+    def test_multilook_complex64(self, nlooks):
+        # Expected output array.
+        real = da.arange(12, dtype=np.float32)
+        imag = da.arange(12, 24, dtype=np.float32)
+        expected = (real + 1j * imag).reshape(3, 4).astype(np.complex64)
+
+        # Build the input array by repeating each element `nlooks` times.
+        input = expected
+        for axis, n in enumerate(nlooks):
+            input = da.repeat(input, repeats=n, axis=axis)
+
+        # Multilook.
+        output = tophu.multilook(input, nlooks=nlooks)
+
+        # Check results. Single-precision complex inputs should not be promoted.
+        assert output.shape == expected.shape
+        assert output.dtype == np.complex64
+        assert da.allclose(output, expected, rtol=1e-6, atol=1e-6)
+
+    def test_multilook_float16(self):
+        # The sum of each group of looks exceeds the largest finite float16 value, so
+        # it must be accumulated in a wider datatype.
+        input = da.full((10, 10), 3000.0, dtype=np.float16, chunks=5)
+        output = tophu.multilook(input, nlooks=(5, 5))
+
+        # Check results. The output datatype should still be half precision.
+        assert output.shape == (2, 2)
+        assert output.dtype == np.float16
+        assert np.array_equal(output.compute(), np.full((2, 2), 3000.0, np.float16))
+
+    def test_multilook_integer(self):
+        # Expected output array. Integer-valued inputs should be promoted to float64.
+        expected = da.arange(12, dtype=np.float64).reshape(3, 4)
+
+        # Build the input array by repeating each element `nlooks` times.
+        nlooks = (3, 5)
+        input = expected.astype(np.int16)
+        for axis, n in enumerate(nlooks):
+            input = da.repeat(input, repeats=n, axis=axis)
+
+        # Multilook.
+        output = tophu.multilook(input, nlooks=nlooks)
+
+        # Check results.
+        assert output.shape == expected.shape
+        assert output.dtype == expected.dtype
+        assert da.allclose(output, expected, rtol=1e-12, atol=1e-12)
+
+    @pytest.mark.parametrize("nlooks", [3, 7])
+    def test_multilook_masked(self, nlooks):
+        # Mask one element of the input array. Masked elements should be excluded from
+        # the mean.
+        data = np.arange(3 * nlooks, dtype=np.float64)
+        mask = np.zeros_like(data, dtype=bool)
+        mask[2] = True
+        input = da.from_array(np.ma.masked_array(data, mask=mask))
+
+        # Multilook.
+        output = tophu.multilook(input, nlooks=nlooks).compute()
+
+        # Check results.
+        expected = np.ma.masked_array(data, mask=mask).reshape(3, nlooks).mean(axis=1)
+        assert isinstance(output, np.ma.MaskedArray)
+        assert output.dtype == np.float64
+        assert not np.any(np.ma.getmaskarray(output))
+        np.testing.assert_allclose(output.data, expected.data, rtol=1e-12, atol=1e-12)
+
+    def test_multilook_fortran_order(self):
+        # Expected output array.
+        expected = np.arange(12, dtype=np.float64).reshape(3, 4)
+
+        # Build a Fortran-ordered input array by repeating each element `nlooks` times.
+        nlooks = (3, 7)
+        input = expected
+        for axis, n in enumerate(nlooks):
+            input = np.repeat(input, repeats=n, axis=axis)
+        input = da.from_array(np.asfortranarray(input), chunks=(6, 14))
+
+        # Multilook.
+        output = tophu.multilook(input, nlooks=nlooks)
+
+        # Check results.
+        assert output.shape == expected.shape
+        assert output.dtype == expected.dtype
+        assert da.allclose(output, expected, rtol=1e-12, atol=1e-12)
+
+    @pytest.mark.parametrize("nlooks", [3, 11])
+    def test_high_precision(self, nlooks):
+        # Each group of looks contains one large value followed by ones. The ones are
+        # lost to rounding error if the sum is accumulated in single precision.
+        input = np.ones(4 * nlooks, dtype=np.float32)
+        input[::nlooks] = 2.0**24
+        input = da.from_array(input)
+        expected = np.full(4, (2.0**24 + nlooks - 1) / nlooks, dtype=np.float32)
+
+        # Multilook.
+        output = tophu.multilook(input, nlooks=nlooks, high_precision=True)
+
+        # Check results. The output datatype should still be single precision.
+        assert output.dtype == np.float32
+        assert np.array_equal(output.compute(), expected)
+
+    def test_single_look(self):
+        # Check that multilooking with a single look along each axis returns the input
+        # array unchanged.
+        input = da.arange(60, dtype=np.int32).reshape(6, 10)
+        output = tophu.multilook(input, nlooks=1)
+        assert output is input
+
     def test_non_multiple_shape(self):
         # Generate input & expected output.
         input = da.arange(25, dtype=np.float64, chunks=(9,))
@@ -95,6 +205,52 @@ class TestMultilook:
         assert output.dtype == expected.dtype
         assert da.allclose(output, expected, rtol=1e-12, atol=1e-12)
 
+    def test_unaligned_chunks(self):
+        # Generate input & expected output. The input chunk size is not an integer
+        # multiple of `nlooks`.
+        expected = da.arange(12, dtype=np.float64).reshape(3, 4)
+        nlooks = (3, 5)
+        input = expected
+        for axis, n in enumerate(nlooks):
+            input = da.repeat(input, repeats=n, axis=axis)
+        input = input.rechunk((4, 7))
+
+        # Multilook.
+        output = tophu.multilook(input, nlooks=nlooks)
+
+        # Check results.
+        assert output.shape == expected.shape
+        assert output.dtype == expected.dtype
+        assert da.allclose(output, expected, rtol=1e-12, atol=1e-12)
+
+    def test_aligned_chunks(self):
+        # Check that chunk boundaries are moved to the nearest multiple of `nlooks`
+        # when the input chunk sizes are not integer multiples of `nlooks`.
+        input = da.ones(30, dtype=np.float64, chunks=(10,))
+        output = tophu.multilook(input, nlooks=3)
+        assert output.chunks == ((3, 4, 3),)
+
+    @pytest.mark.parametrize(
+        "nlooks",
+        [
+            np.int64(3),
+            np.array(3),
+            (np.int32(3), 3),
+            np.array([3, 3]),
+            [3, 3],
+            iter([3, 3]),
+            (n for n in (3, 3)),
+        ],
+    )
+    def test_nlooks_types(self, nlooks):
+        # Check that NumPy integers, 0-D arrays, and arbitrary iterables (including
+        # generators) are accepted as `nlooks`.
+        input = da.arange(36, dtype=np.float64).reshape(6, 6)
+        output = tophu.multilook(input, nlooks=nlooks)
+        expected = tophu.multilook(input, nlooks=(3, 3))
+        assert output.shape == (2, 2)
+        assert da.allclose(output, expected, rtol=1e-12, atol=1e-12)
+
     def test_nlooks_length_mismatch(self):
         # Check that `multilook()` fails if length of `nlooks` doesn't match `arr.ndim`.
         arr = da.zeros((15, 15), dtype=np.float64)
@@ -134,6 +290,9 @@ class TestMultilook:
             substr = "one or more components of nlooks is even-valued"
             assert substr in str(w[0].message)
 
+            # Check that the warning is attributed to the caller.
+            assert w[0].filename == __file__
+
     def test_throwaway_samples_warning(self):
         # Check that a warning is emitted if there are throwaway samples due to
         # the input array shape not being an integer multiple of `nlooks`.
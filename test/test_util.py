@@ -185,6 +185,9 @@ def test_iseven():
     assert not tophu.iseven(1)
     assert not tophu.iseven(-5)
     assert not tophu.iseven((1 << 20) - 1)
+    assert tophu.iseven(4.0)
+    assert tophu.iseven(np.float64(4))
+    assert not tophu.iseven(np.float64(3))
 
 
 def random_integer_array(